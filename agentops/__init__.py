@@ -102,6 +102,7 @@ def configure(**kwargs):
             - api_key: API Key for AgentOps services
             - endpoint: The endpoint for the AgentOps service
             - max_wait_time: Maximum time to wait in milliseconds before flushing the queue
+            - export_timeout: Maximum time in milliseconds a single telemetry export request may take
             - max_queue_size: Maximum size of the event queue
             - default_tags: Default tags for the sessions
             - instrument_llm_calls: Whether to instrument LLM calls
@@ -119,6 +120,7 @@ def configure(**kwargs):
         "api_key",
         "endpoint",
         "max_wait_time",
+        "export_timeout",
         "max_queue_size",
         "default_tags",
         "instrument_llm_calls",
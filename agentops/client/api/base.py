@@ -4,7 +4,7 @@ Base API client classes for making HTTP requests.
 This module provides the foundation for all API clients in the AgentOps SDK.
 """
 
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, ClassVar, Dict, Optional, Protocol
 
 import requests
 
@@ -27,6 +27,13 @@ class BaseApiClient:
     It should be used for APIs that don't require authentication.
     """
 
+    # Standard headers sent with every request; copied per call, never mutated
+    _DEFAULT_HEADERS: ClassVar[Dict[str, str]] = {
+        "Content-Type": "application/json",
+        "Connection": "keep-alive",
+        "Keep-Alive": "timeout=10, max=1000",
+    }
+
     def __init__(self, endpoint: str):
         """
         Initialize the base API client.
@@ -48,16 +55,10 @@ class BaseApiClient:
         Returns:
             Headers dictionary with standard headers and any custom headers
         """
-        headers = {
-            "Content-Type": "application/json",
-            "Connection": "keep-alive",
-            "Keep-Alive": "timeout=10, max=1000",
-        }
-
         if custom_headers:
-            headers.update(custom_headers)
+            return {**self._DEFAULT_HEADERS, **custom_headers}
 
-        return headers
+        return dict(self._DEFAULT_HEADERS)
 
     def _get_full_url(self, path: str) -> str:
         """
@@ -1,7 +1,7 @@
 from typing import List, Optional, Union
 
 from agentops.client.api import ApiClient
-from agentops.config import Config
+from agentops.config import Config, get_config
 from agentops.exceptions import AgentOpsClientNotInitializedException, NoApiKeyException, NoSessionException
 from agentops.instrumentation import instrument_all
 from agentops.logging import logger
@@ -26,7 +26,7 @@ class Client:
     def __init__(self):
         # Only initialize once
         self._initialized = False
-        self.config = Config()
+        self.config = get_config()
 
     def init(self, **kwargs):
         # Recreate the Config object to parse environment variables at the time of initialization
@@ -84,6 +84,3 @@ class Client:
         if self._initialized and self._initialized != value:
             raise ValueError("Client already initialized")
         self._initialized = value
-
-    # ------------------------------------------------------------
-    __instance = None
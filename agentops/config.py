@@ -1,8 +1,10 @@
 import json
 import logging
 import os
+import re
 import sys
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import Any, List, Optional, Set, TypedDict, Union
 from uuid import UUID
 
@@ -13,7 +15,9 @@ from agentops.exceptions import InvalidApiKeyException
 from agentops.helpers.env import get_env_bool, get_env_int, get_env_list
 from agentops.helpers.serialization import AgentOpsJSONEncoder
 
-from .logging.config import logger
+from .logging.config import LOG_LEVELS, logger
+
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
 
 
 class ConfigDict(TypedDict):
@@ -21,6 +25,7 @@ class ConfigDict(TypedDict):
     endpoint: Optional[str]
     max_wait_time: Optional[int]
     export_flush_interval: Optional[int]
+    export_timeout: Optional[int]
     max_queue_size: Optional[int]
     default_tags: Optional[List[str]]
     instrument_llm_calls: Optional[bool]
@@ -55,6 +60,11 @@ class Config:
         metadata={"description": "Time interval in milliseconds between automatic exports of telemetry data"},
     )
 
+    export_timeout: int = field(
+        default_factory=lambda: get_env_int("AGENTOPS_EXPORT_TIMEOUT", 10000),
+        metadata={"description": "Maximum time in milliseconds a single telemetry export request may take"},
+    )
+
     max_queue_size: int = field(
         default_factory=lambda: get_env_int("AGENTOPS_MAX_QUEUE_SIZE", 512),
         metadata={"description": "Maximum number of events to queue before forcing a flush"},
@@ -113,11 +123,11 @@ class Config:
     )
 
     exporter: Optional[SpanExporter] = field(
-        default_factory=lambda: None, metadata={"description": "Custom span exporter for OpenTelemetry trace data"}
+        default=None, metadata={"description": "Custom span exporter for OpenTelemetry trace data"}
     )
 
     processor: Optional[SpanProcessor] = field(
-        default_factory=lambda: None, metadata={"description": "Custom span processor for OpenTelemetry trace data"}
+        default=None, metadata={"description": "Custom span processor for OpenTelemetry trace data"}
     )
 
     def configure(
@@ -126,6 +136,7 @@ class Config:
         endpoint: Optional[str] = None,
         max_wait_time: Optional[int] = None,
         export_flush_interval: Optional[int] = None,
+        export_timeout: Optional[int] = None,
         max_queue_size: Optional[int] = None,
         default_tags: Optional[List[str]] = None,
         instrument_llm_calls: Optional[bool] = None,
@@ -143,7 +154,8 @@ class Config:
         """Configure settings from kwargs, validating where necessary"""
         if api_key is not None:
             self.api_key = api_key
-            if not TESTING:  # Allow setting dummy keys in tests
+            if not TESTING and not _UUID_RE.match(api_key):  # Allow setting dummy keys in tests
+                # Canonical keys skip UUID construction; other spellings UUID() accepts still validate
                 try:
                     UUID(api_key)
                 except ValueError:
@@ -158,6 +170,9 @@ class Config:
         if export_flush_interval is not None:
             self.export_flush_interval = export_flush_interval
 
+        if export_timeout is not None:
+            self.export_timeout = export_timeout
+
         if max_queue_size is not None:
             self.max_queue_size = max_queue_size
 
@@ -181,11 +196,7 @@ class Config:
 
         if log_level is not None:
             if isinstance(log_level, str):
-                log_level_str = log_level.upper()
-                if hasattr(logging, log_level_str):
-                    self.log_level = getattr(logging, log_level_str)
-                else:
-                    self.log_level = logging.INFO
+                self.log_level = LOG_LEVELS.get(log_level.upper(), logging.INFO)
             else:
                 self.log_level = log_level
 
@@ -213,6 +224,7 @@ class Config:
             "endpoint": self.endpoint,
             "max_wait_time": self.max_wait_time,
             "export_flush_interval": self.export_flush_interval,
+            "export_timeout": self.export_timeout,
             "max_queue_size": self.max_queue_size,
             "default_tags": self.default_tags,
             "instrument_llm_calls": self.instrument_llm_calls,
@@ -233,5 +245,17 @@ class Config:
         return json.dumps(self.dict(), cls=AgentOpsJSONEncoder)
 
 
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Return the process-wide default Config, parsing the environment only once.
+
+    `configure()` calls mutate this shared instance in place. Code that needs the
+    environment re-read (e.g. tests that patch os.environ) should call
+    `get_config.cache_clear()` or construct `Config()` directly.
+    """
+    return Config()
+
+
 # checks if pytest is imported
 TESTING = "pytest" in sys.modules
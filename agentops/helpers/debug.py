@@ -1,3 +1,4 @@
+import logging
 from functools import wraps
 from pprint import pformat
 
@@ -7,6 +8,10 @@ from agentops.logging import logger
 def debug_print_function_params(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
+        # pformat of every argument is costly; skip it unless it will be logged
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(self, *args, **kwargs)
+
         logger.debug("\n<AGENTOPS_DEBUG_OUTPUT>")
         logger.debug(f"{func.__name__} called with arguments:")
 
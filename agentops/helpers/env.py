@@ -3,6 +3,8 @@
 import os
 from typing import List, Optional, Set
 
+_TRUTHY = frozenset(("true", "1", "t", "yes"))
+
 
 def get_env_bool(key: str, default: bool) -> bool:
     """Get boolean from environment variable
@@ -17,7 +19,7 @@ def get_env_bool(key: str, default: bool) -> bool:
     val = os.getenv(key)
     if val is None:
         return default
-    return val.lower() in ("true", "1", "t", "yes")
+    return val.lower() in _TRUTHY
 
 
 def get_env_int(key: str, default: int) -> int:
@@ -30,8 +32,11 @@ def get_env_int(key: str, default: int) -> int:
     Returns:
         int: Parsed integer value
     """
+    val = os.getenv(key)
+    if val is None:
+        return default
     try:
-        return int(os.getenv(key, default))
+        return int(val)
     except (TypeError, ValueError):
         return default
 
@@ -4,13 +4,19 @@ import json
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Dict
 from uuid import UUID
 
 from agentops.logging import logger
 
 
+# Exact types json.dumps always accepts; checked before attempting an encode
+_JSON_PRIMITIVES = frozenset((str, int, float, bool, type(None)))
+
+
 def is_jsonable(x):
+    if type(x) in _JSON_PRIMITIVES:
+        return True
     try:
         json.dumps(x)
         return True
@@ -19,39 +25,42 @@ def is_jsonable(x):
 
 
 def filter_unjsonable(d: dict) -> dict:
+    def filter_value(v):
+        if isinstance(v, (dict, list)):
+            return filter_dict(v)
+        # UUIDs never pass json.dumps; stringify them without a failed encode attempt
+        if isinstance(v, UUID):
+            return str(v)
+        return v if is_jsonable(v) else ""
+
     def filter_dict(obj):
         if isinstance(obj, dict):
-            return {
-                k: (
-                    filter_dict(v)
-                    if isinstance(v, (dict, list)) or is_jsonable(v)
-                    else str(v)
-                    if isinstance(v, UUID)
-                    else ""
-                )
-                for k, v in obj.items()
-            }
+            return {k: filter_value(v) for k, v in obj.items()}
         elif isinstance(obj, list):
-            return [
-                (
-                    filter_dict(x)
-                    if isinstance(x, (dict, list)) or is_jsonable(x)
-                    else str(x)
-                    if isinstance(x, UUID)
-                    else ""
-                )
-                for x in obj
-            ]
+            return [filter_value(x) for x in obj]
         else:
             return obj if is_jsonable(obj) or isinstance(obj, UUID) else ""
 
     return filter_dict(d)
 
 
+# Exact-type fast path for AgentOpsJSONEncoder.default; subclasses and
+# duck-typed objects fall through to the isinstance checks below.
+_DEFAULT_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    UUID: str,
+    datetime: datetime.isoformat,
+    Decimal: str,
+    set: list,
+}
+
+
 class AgentOpsJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for AgentOps types"""
 
     def default(self, obj: Any) -> Any:
+        encode = _DEFAULT_ENCODERS.get(type(obj))
+        if encode is not None:
+            return encode(obj)
         if isinstance(obj, UUID):
             return str(obj)
         if isinstance(obj, datetime):
@@ -60,8 +69,10 @@ class AgentOpsJSONEncoder(json.JSONEncoder):
             return str(obj)
         if isinstance(obj, set):
             return list(obj)
-        if hasattr(obj, "to_json"):
-            return obj.to_json()
+        # One attribute lookup instead of hasattr() followed by a second fetch
+        to_json = getattr(obj, "to_json", None)
+        if to_json is not None:
+            return to_json()
         if isinstance(obj, Enum):
             return obj.value
         return str(obj)
@@ -72,10 +83,15 @@ def serialize_uuid(obj: UUID) -> str:
     return str(obj)
 
 
+# Encoders are stateless between calls; reuse one instead of building a new
+# AgentOpsJSONEncoder for every json.dumps(..., cls=...) call
+_encoder = AgentOpsJSONEncoder()
+
+
 def safe_serialize(obj: Any) -> Any:
     """Safely serialize an object to JSON-compatible format"""
     try:
-        return json.dumps(obj, cls=AgentOpsJSONEncoder)
+        return _encoder.encode(obj)
     except (TypeError, ValueError) as e:
         logger.warning(f"Failed to serialize object: {e}")
         return str(obj)
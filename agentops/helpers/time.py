@@ -1,20 +1,44 @@
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second.
+# Replaced as a whole tuple, so concurrent readers always see a matching pair.
+_last_second = (-1, "")
 
 
 def get_ISO_time():
     """
-    Get the current UTC time in ISO 8601 format with milliseconds precision in UTC timezone.
+    Get the current UTC time in ISO 8601 format with microseconds precision in UTC timezone.
+
+    The date/time part is formatted once per wall-clock second and reused; only the
+    sub-second suffix is built per call. Output matches `datetime.isoformat()`.
 
     Returns:
         str: The current UTC time as a string in ISO 8601 format.
     """
-    return datetime.now(timezone.utc).isoformat()
+    global _last_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached = _last_second
+    if cached[0] != seconds:
+        cached = (seconds, datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+        _last_second = cached
+    if micros:
+        return f"{cached[1]}.{micros:06d}+00:00"
+    return f"{cached[1]}+00:00"
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 def iso_to_unix_nano(iso_time: str) -> int:
+    # Integer arithmetic keeps full microsecond precision; going through the float
+    # from `timestamp()` rounds present-day values by up to a few hundred nanoseconds
     dt = datetime.fromisoformat(iso_time)
-    return int(dt.timestamp() * 1_000_000_000)
+    if dt.tzinfo is None:
+        dt = dt.astimezone()  # naive values are local time, as `timestamp()` assumes
+    return (dt - _EPOCH) // _MICROSECOND * 1000
 
 
 def from_unix_nano_to_iso(unix_nano: int) -> str:
-    return datetime.fromtimestamp(unix_nano / 1_000_000_000, timezone.utc).isoformat()
+    return (_EPOCH + timedelta(microseconds=unix_nano // 1000)).isoformat()
@@ -9,8 +9,11 @@ These integrations use different patterns:
 This module maintains backward compatibility with all these API patterns.
 """
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any, Dict, List, Tuple, Union
 
+from agentops.helpers.time import get_ISO_time
 from agentops.logging import logger
 from agentops.sdk.core import TracingCore
 from agentops.semconv.span_kinds import SpanKind
@@ -18,6 +21,10 @@ from agentops.exceptions import AgentOpsClientNotInitializedException
 
 _current_session: Optional["Session"] = None
 
+# Single worker so session-end flushes run in order, off the caller's thread
+_flush_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentops-flush")
+atexit.register(_flush_executor.shutdown, wait=True)
+
 
 class Session:
     """
@@ -57,7 +64,7 @@ class Session:
         """
         pass
 
-    def end_session(self, **kwargs):
+    def end_session(self, *, wait: bool = False, **kwargs):
         """
         Method to end the session for CrewAI >= 0.105.0 compatibility.
         
@@ -65,11 +72,13 @@ class Session:
         - end_state="Success"
         - end_state_reason="Finished Execution"
         
-        forces a flush to ensure the span is exported immediately.
+        Schedules a flush of the span processors so the span is exported promptly.
+        The flush runs on a background worker unless `wait=True` is passed, in
+        which case this call blocks until the flush completes.
         """
         _set_span_attributes(self.span, kwargs)
         self.span.end()
-        _flush_span_processors()
+        _flush_span_processors(wait=wait)
 
 
 def _create_session_span(tags: Union[Dict[str, Any], List[str], None] = None) -> tuple:
@@ -146,26 +155,54 @@ def _set_span_attributes(span: Any, attributes: Dict[str, Any]) -> None:
         span: The span to set attributes on
         attributes: The attributes to set as a dictionary
     """
-    if not attributes or not hasattr(span, "set_attribute"):
+    set_attributes = getattr(span, "set_attributes", None)
+    if not attributes or set_attributes is None:
+        return
+
+    # Skip building the attribute strings when the span won't keep them
+    is_recording = getattr(span, "is_recording", None)
+    if is_recording is not None and not is_recording():
         return
         
-    for key, value in attributes.items():
-        span.set_attribute(f"agentops.status.{key}", str(value))
+    # One set_attributes call takes the span's lock once instead of per key;
+    # only non-string values need converting
+    set_attributes(
+        {
+            f"agentops.status.{key}": value if type(value) is str else str(value)
+            for key, value in attributes.items()
+        }
+    )
 
 
-def _flush_span_processors() -> None:
-    """
-    Helper to force flush all span processors.
-    """
+def _force_flush() -> None:
     try:
         from opentelemetry.trace import get_tracer_provider
         tracer_provider = get_tracer_provider()
         tracer_provider.force_flush()  # type: ignore
     except Exception as e:
         logger.warning(f"Failed to force flush span processor: {e}")
+
+
+def _flush_span_processors(wait: bool = False) -> None:
+    """
+    Helper to force flush all span processors.
+
+    Args:
+        wait: Block until the flush completes. By default the flush runs on a
+              background worker so ending a session doesn't wait on the network;
+              pending flushes are still completed at interpreter exit.
+    """
+    if wait:
+        _force_flush()
+        return
+    try:
+        _flush_executor.submit(_force_flush)
+    except RuntimeError:
+        # Executor already shut down (interpreter exiting)
+        _force_flush()
         
 
-def end_session(session_or_status: Any = None, **kwargs) -> None:
+def end_session(session_or_status: Any = None, *, wait: bool = False, **kwargs) -> None:
     """
     @deprecated
     End a previously started AgentOps session.
@@ -189,6 +226,9 @@ def end_session(session_or_status: Any = None, **kwargs) -> None:
                  
                  When called this way, the function will use the most recently
                  created session via start_session().
+        wait: Block until the span processors have been flushed. By default the
+              flush runs on a background worker so ending a session doesn't wait
+              on the network.
     """
     from agentops.sdk.decorators.utility import _finalize_span
     
@@ -215,7 +255,7 @@ def end_session(session_or_status: Any = None, **kwargs) -> None:
         if _current_session is not None:
             _set_span_attributes(_current_session.span, kwargs)
             _finalize_span(_current_session.span, _current_session.token)
-            _flush_span_processors()
+            _flush_span_processors(wait=wait)
             _current_session = None
         return
     
@@ -225,7 +265,7 @@ def end_session(session_or_status: Any = None, **kwargs) -> None:
     if hasattr(session_or_status, 'span') and hasattr(session_or_status, 'token'):
         _set_span_attributes(session_or_status.span, kwargs)
         _finalize_span(session_or_status.span, session_or_status.token)
-        _flush_span_processors()
+        _flush_span_processors(wait=wait)
 
 
 def end_all_sessions():
@@ -237,6 +277,21 @@ def end_all_sessions():
     end_session()
 
 
+class _LegacyEvent:
+    """
+    Minimal event object returned by the deprecated event constructors.
+
+    Defined once at module level so that each ErrorEvent()/ActionEvent() call
+    only pays for the instance, not for building a new class. Instances keep a
+    regular __dict__: legacy callers set fields such as `returns` or `logs` on
+    the event before passing it to agentops.record().
+    """
+
+    def __init__(self):
+        self.init_timestamp = get_ISO_time()
+        self.end_timestamp = None
+
+
 def ToolEvent(*args, **kwargs) -> None:
     """
     @deprecated
@@ -253,14 +308,7 @@ def ErrorEvent(*args, **kwargs):
     For backward compatibility with tests, this returns a minimal object with the
     required attributes.
     """
-    from agentops.helpers.time import get_ISO_time
-    
-    class LegacyErrorEvent:
-        def __init__(self):
-            self.init_timestamp = get_ISO_time()
-            self.end_timestamp = None
-    
-    return LegacyErrorEvent()
+    return _LegacyEvent()
 
 
 def ActionEvent(*args, **kwargs):
@@ -271,14 +319,7 @@ def ActionEvent(*args, **kwargs):
     For backward compatibility with tests, this returns a minimal object with the
     required attributes.
     """
-    from agentops.helpers.time import get_ISO_time
-    
-    class LegacyActionEvent:
-        def __init__(self):
-            self.init_timestamp = get_ISO_time()
-            self.end_timestamp = None
-    
-    return LegacyActionEvent()
+    return _LegacyEvent()
 
 
 def LLMEvent(*args, **kwargs) -> None:
@@ -5,14 +5,33 @@ Data Class:
     Event: Represents discrete events to be recorded.
 """
 
+import sys
 import traceback
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID, uuid4
 
 from agentops.helpers import get_ISO_time
 
+# Events are created for every LLM/tool/action call; slotted dataclasses avoid a
+# per-instance __dict__. `slots=` is only accepted by dataclass on Python 3.10+.
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of an Event class, resolved once per class"""
+    return tuple(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _field_getter(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+    """A single attrgetter returning every field value of an Event class as a tuple"""
+    return attrgetter(*_field_names(cls))
+
 
 class EventType(Enum):
     LLM = "llms"
@@ -22,7 +41,7 @@ class EventType(Enum):
     ERROR = "errors"
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Event:
     """
     Abstract base class for events that will be recorded. Should not be instantiated directly.
@@ -55,8 +74,13 @@ class Event:
     id: UUID = field(default_factory=uuid4)
     session_id: Optional[UUID] = None
 
+    def to_json(self) -> Dict[str, Any]:
+        """Return the fields that are set on this event; used by AgentOpsJSONEncoder"""
+        cls = type(self)
+        return {name: value for name, value in zip(_field_names(cls), _field_getter(cls)(self)) if value is not None}
+
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ActionEvent(Event):
     """
     For generic events
@@ -73,7 +97,7 @@ class ActionEvent(Event):
     screenshot: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class LLMEvent(Event):
     """
     For recording calls to LLMs. AgentOps auto-instruments calls to the most popular LLMs e.g. GPT, Claude, Gemini, etc.
@@ -97,7 +121,7 @@ class LLMEvent(Event):
     model: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ToolEvent(Event):
     """
     For recording calls to tools e.g. searchWeb, fetchFromDB
@@ -115,7 +139,7 @@ class ToolEvent(Event):
 # Does not inherit from Event because error will (optionally) be linked to an ActionEvent, LLMEvent, etc that will have the details
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ErrorEvent(Event):
     """
     For recording any errors e.g. ones related to agent execution
@@ -125,7 +149,7 @@ class ErrorEvent(Event):
     error_type(str, optional): The type of error e.g. "ValueError".
     code(str, optional): A code that can be used to identify the error e.g. 501.
     details(str, optional): Detailed information about the error.
-    logs(str, optional): For detailed information/logging related to the error.
+    logs(str, optional): For detailed information/logging related to the error. Defaults to the traceback of `exception` when one is given.
     """
 
     # Inherit common Event fields
@@ -137,13 +161,18 @@ class ErrorEvent(Event):
     error_type: Optional[str] = None
     code: Optional[str] = None
     details: Optional[Union[str, Dict[str, str]]] = None
-    logs: Optional[str] = field(default_factory=traceback.format_exc)
+    logs: Optional[str] = None
 
     def __post_init__(self):
         """Process exception if provided"""
         if self.exception:
             self.error_type = self.error_type or type(self.exception).__name__
             self.details = self.details or str(self.exception)
+            if self.logs is None:
+                # Only format a traceback when there is an exception to describe
+                self.logs = "".join(
+                    traceback.format_exception(type(self.exception), self.exception, self.exception.__traceback__)
+                )
             self.exception = None  # removes exception from serialization
 
         # Ensure end timestamp is set
@@ -10,6 +10,11 @@ logger = logging.getLogger("agentops")
 logger.propagate = False
 logger.setLevel(logging.CRITICAL)
 
+# Upper-case level name -> numeric level, resolved once instead of probing the logging module
+LOG_LEVELS = {
+    name: getattr(logging, name) for name in ("CRITICAL", "FATAL", "ERROR", "WARNING", "WARN", "INFO", "DEBUG", "NOTSET")
+}
+
 
 def configure_logging(config=None):  # Remove type hint temporarily to avoid circular import
     """Configure the AgentOps logger with console and optional file handlers.
@@ -19,22 +24,17 @@ def configure_logging(config=None):  # Remove type hint temporarily to avoid cir
     """
     # Defer the Config import to avoid circular dependency
     if config is None:
-        from agentops.config import Config
+        from agentops.config import get_config
 
-        config = Config()
+        config = get_config()
 
     # Use env var as override if present, otherwise use config
     log_level_env = os.environ.get("AGENTOPS_LOG_LEVEL", "").upper()
-    if log_level_env and hasattr(logging, log_level_env):
-        log_level = getattr(logging, log_level_env)
-    else:
+    log_level = LOG_LEVELS.get(log_level_env)
+    if log_level is None:
         # Handle string log levels from config
         if isinstance(config.log_level, str):
-            log_level_str = config.log_level.upper()
-            if hasattr(logging, log_level_str):
-                log_level = getattr(logging, log_level_str)
-            else:
-                log_level = logging.INFO
+            log_level = LOG_LEVELS.get(config.log_level.upper(), logging.INFO)
         else:
             log_level = config.log_level if isinstance(config.log_level, int) else logging.INFO
 
@@ -2,8 +2,10 @@
 Legacy helpers that were being used throughout the SDK
 """
 
+import re
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
@@ -20,22 +22,34 @@ def ns_to_iso(ns_time: Optional[int]) -> Optional[str]:
 
 
 def trace_id_to_uuid(trace_id: int) -> UUID:
-    # Convert the trace_id to a 32-character hex string
-    trace_id_hex = format(trace_id, "032x")
-
-    # Format as UUID string (8-4-4-4-12)
-    uuid_str = (
-        f"{trace_id_hex[0:8]}-{trace_id_hex[8:12]}-{trace_id_hex[12:16]}-{trace_id_hex[16:20]}-{trace_id_hex[20:32]}"
-    )
-
-    # Create UUID object
-    return UUID(uuid_str)
+    # A trace_id is a 128-bit integer, exactly a UUID's width
+    return UUID(int=trace_id)
 
 
 def uuid_to_int16(uuid: UUID) -> int:
     return int(uuid.hex, 16)
 
 
+# Exact types accepted as-is for an OpenTelemetry AttributeValue
+_PRIMITIVE_TYPES = frozenset((str, bool, int, float))
+
+
+def _is_homogeneous(values) -> bool:
+    """Whether a sequence holds only str, only bool, only int or only float values.
+
+    Checks all four element types in a single pass, stopping as soon as none can match.
+    """
+    is_str = is_bool = is_int = is_float = True
+    for x in values:
+        is_str = is_str and isinstance(x, str)
+        is_bool = is_bool and isinstance(x, bool)
+        is_int = is_int and isinstance(x, int)
+        is_float = is_float and isinstance(x, float)
+        if not (is_str or is_bool or is_int or is_float):
+            return False
+    return True
+
+
 def dict_to_span_attributes(data: dict, prefix: str = "") -> Attributes:
     """Convert a dictionary to OpenTelemetry span attributes.
 
@@ -60,24 +74,22 @@ def dict_to_span_attributes(data: dict, prefix: str = "") -> Attributes:
 
     def _flatten(obj, parent_key=""):
         if isinstance(obj, dict):
+            # parent_key already carries the prefix, so it is only applied at the top level
+            key_prefix = f"{parent_key}." if parent_key else prefix
             for key, value in obj.items():
-                new_key = f"{parent_key}.{key}" if parent_key else key
-                if prefix:
-                    new_key = f"{prefix}{new_key}"
+                new_key = f"{key_prefix}{key}"
 
-                if isinstance(value, dict):
+                value_type = type(value)
+                if value_type in _PRIMITIVE_TYPES:
+                    # Exact primitive types are by far the common case; skip the ladder
+                    attributes[new_key] = value
+                elif isinstance(value, dict):
                     _flatten(value, new_key)
                 elif isinstance(value, (str, bool, int, float)):
                     attributes[new_key] = value
                 elif isinstance(value, (list, tuple)):
                     # Only include sequences if they contain valid types
-                    if value and all(isinstance(x, str) for x in value):
-                        attributes[new_key] = list(value)
-                    elif value and all(isinstance(x, bool) for x in value):
-                        attributes[new_key] = list(value)
-                    elif value and all(isinstance(x, int) for x in value):
-                        attributes[new_key] = list(value)
-                    elif value and all(isinstance(x, float) for x in value):
+                    if value and _is_homogeneous(value):
                         attributes[new_key] = list(value)
                     else:
                         # Convert mixed/unsupported sequences to string
@@ -92,9 +104,9 @@ def dict_to_span_attributes(data: dict, prefix: str = "") -> Attributes:
 
 def uuid_to_int(uuid_str):
     """Convert a UUID string to a decimal integer."""
-    # If input is a UUID object, convert to string
+    # A UUID object already carries its integer value; no need to format and re-parse it
     if isinstance(uuid_str, uuid.UUID):
-        uuid_str = str(uuid_str)
+        return uuid_str.int
 
     # Remove hyphens if they exist
     uuid_str = uuid_str.replace("-", "")
@@ -105,22 +117,16 @@ def uuid_to_int(uuid_str):
 
 def int_to_uuid(integer):
     """Convert a decimal integer back to a UUID object."""
-    # Convert the integer to hex and remove '0x' prefix
-    hex_str = hex(integer)[2:]
-
-    # Pad with zeros to ensure it's 32 characters long (128 bits)
-    hex_str = hex_str.zfill(32)
+    return uuid.UUID(int=integer)
 
-    # Insert hyphens in the correct positions
-    uuid_str = f"{hex_str[:8]}-{hex_str[8:12]}-{hex_str[12:16]}-{hex_str[16:20]}-{hex_str[20:]}"
 
-    # Return as UUID object
-    return uuid.UUID(uuid_str)
+_CAMEL_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
 
 
+@lru_cache(maxsize=256)
 def camel_to_snake(text: str) -> str:
     """Convert CamelCase class names to snake_case format"""
-    import re
-
-    text = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", text)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", text).lower()
+    # Callers pass a small, fixed set of class names, so results are memoized
+    text = _CAMEL_WORD_RE.sub(r"\1_\2", text)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", text).lower()
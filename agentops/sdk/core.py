@@ -1,16 +1,14 @@
 from __future__ import annotations
 
 import atexit
+import os
 import threading
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from opentelemetry import metrics, trace
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import \
-    OTLPMetricExporter
+from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import \
     OTLPSpanExporter
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -21,8 +19,19 @@ from agentops.sdk.processors import InternalSpanProcessor
 from agentops.sdk.types import TracingConfig
 from agentops.semconv import ResourceAttributes
 
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics import MeterProvider
+
 # No need to create shortcuts since we're using our own ResourceAttributes class now
 
+# Number of export batches the span queue can hold before dropping spans
+_QUEUED_BATCHES = 4
+
+
+def _otlp_compression_configured() -> bool:
+    """Whether OTLP trace compression was set explicitly via the environment"""
+    return bool(os.environ.get("OTEL_EXPORTER_OTLP_TRACES_COMPRESSION") or os.environ.get("OTEL_EXPORTER_OTLP_COMPRESSION"))
+
 
 def setup_telemetry(
     service_name: str = "agentops",
@@ -32,6 +41,7 @@ def setup_telemetry(
     max_queue_size: int = 512,
     max_wait_time: int = 5000,
     export_flush_interval: int = 1000,
+    export_timeout: int = 10000,
     jwt: Optional[str] = None,
 ) -> tuple[TracerProvider, MeterProvider]:
     """
@@ -45,6 +55,7 @@ def setup_telemetry(
         max_queue_size: Maximum number of spans to queue before forcing a flush
         max_wait_time: Maximum time in milliseconds to wait before flushing
         export_flush_interval: Time interval in milliseconds between automatic exports of telemetry data
+        export_timeout: Maximum time in milliseconds a single export request may take
         jwt: JWT token for authentication
 
     Returns:
@@ -65,26 +76,42 @@ def setup_telemetry(
     # Set as global provider
     trace.set_tracer_provider(provider)
 
-    # Create exporter with authentication
+    # Create exporter with authentication. The exporter keeps its own pooled
+    # requests.Session; gzip the payloads unless compression was configured
+    # through the standard OTEL_EXPORTER_OTLP_* environment variables.
+    # `export_timeout` bounds each export request so an unreachable collector
+    # can't hold the export thread indefinitely.
     exporter = OTLPSpanExporter(
         endpoint=exporter_endpoint,
-        headers={"Authorization": f"Bearer {jwt}"} if jwt else {}
+        headers={"Authorization": f"Bearer {jwt}"} if jwt else {},
+        timeout=export_timeout / 1000,
+        compression=None if _otlp_compression_configured() else Compression.Gzip,
     )
 
-    # Regular processor for normal spans and immediate export
+    # Regular processor for normal spans and immediate export.
+    # A full batch of `max_queue_size` spans wakes the export thread early; the
+    # queue itself holds several batches so bursts don't drop spans while one
+    # is in flight (and BatchSpanProcessor requires batch size <= queue size).
     processor = BatchSpanProcessor(
         exporter,
+        max_queue_size=max_queue_size * _QUEUED_BATCHES,
         max_export_batch_size=max_queue_size,
         schedule_delay_millis=export_flush_interval,
     )
     provider.add_span_processor(processor)
     provider.add_span_processor(InternalSpanProcessor())  # Catches spans for AgentOps on-terminal printing
 
-    # Setup metrics
+    # Setup metrics. The metrics SDK and its OTLP exporter are only needed once
+    # telemetry is actually set up, so keep them off the `import agentops` path.
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
     metric_reader = PeriodicExportingMetricReader(
         OTLPMetricExporter(
             endpoint=metrics_endpoint,
-            headers={"Authorization": f"Bearer {jwt}"} if jwt else {}
+            headers={"Authorization": f"Bearer {jwt}"} if jwt else {},
+            timeout=export_timeout / 1000,
         )
     )
     meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
@@ -120,6 +147,8 @@ class TracingCore:
         self._provider = None
         self._initialized = False
         self._config = None
+        # Tracers handed out by get_tracer, reset whenever the provider changes
+        self._tracers: Dict[str, trace.Tracer] = {}
 
         # Register shutdown handler
         atexit.register(self.shutdown)
@@ -137,6 +166,7 @@ class TracingCore:
                 exporter_endpoint: Endpoint for the span exporter
                 max_queue_size: Maximum number of spans to queue before forcing a flush
                 max_wait_time: Maximum time in milliseconds to wait before flushing
+                export_timeout: Maximum time in milliseconds a single export request may take
                 api_key: API key for authentication (required for authenticated exporter)
                 project_id: Project ID to include in resource attributes
         """
@@ -154,6 +184,7 @@ class TracingCore:
             kwargs.setdefault("max_queue_size", 512)
             kwargs.setdefault("max_wait_time", 5000)
             kwargs.setdefault("export_flush_interval", 1000)
+            kwargs.setdefault("export_timeout", 10000)
 
             # Create a TracingConfig from kwargs with proper defaults
             config: TracingConfig = {
@@ -163,6 +194,7 @@ class TracingCore:
                 "max_queue_size": kwargs["max_queue_size"],
                 "max_wait_time": kwargs["max_wait_time"],
                 "export_flush_interval": kwargs["export_flush_interval"],
+                "export_timeout": kwargs["export_timeout"],
                 "api_key": kwargs.get("api_key"),
                 "project_id": kwargs.get("project_id"),
             }
@@ -178,9 +210,11 @@ class TracingCore:
                 max_queue_size=config["max_queue_size"],
                 max_wait_time=config["max_wait_time"],
                 export_flush_interval=config["export_flush_interval"],
+                export_timeout=config["export_timeout"],
                 jwt=jwt,
             )
 
+            self._tracers.clear()
             self._initialized = True
             logger.debug("Tracing core initialized")
 
@@ -198,18 +232,22 @@ class TracingCore:
         """Shutdown the tracing core."""
 
         with self._lock:
-            # Perform a single flush on the SynchronousSpanProcessor (which takes care of all processors' shutdown)
             if not self._initialized:
                 return
-            self._provider._active_span_processor.force_flush(self.config['max_wait_time'])  # type: ignore
 
-            # Shutdown provider
+            # Give pending spans up to `max_wait_time` to be exported, then
+            # shut the provider (and its processors) down
             if self._provider:
+                try:
+                    self._provider.force_flush(self._config["max_wait_time"])  # type: ignore
+                except Exception as e:
+                    logger.warning(f"Error flushing provider: {e}")
                 try:
                     self._provider.shutdown()
                 except Exception as e:
                     logger.warning(f"Error shutting down provider: {e}")
 
+            self._tracers.clear()
             self._initialized = False
 
     def get_tracer(self, name: str = "agentops") -> trace.Tracer:
@@ -225,7 +263,11 @@ class TracingCore:
         if not self._initialized:
             raise AgentOpsClientNotInitializedException
 
-        return trace.get_tracer(name)
+        # Every decorated call asks for a tracer; build each named one only once
+        tracer = self._tracers.get(name)
+        if tracer is None:
+            tracer = self._tracers[name] = trace.get_tracer(name)
+        return tracer
 
     @classmethod
     def initialize_from_config(cls, config, **kwargs):
@@ -256,6 +298,7 @@ class TracingCore:
                     "max_queue_size": getattr(config, "max_queue_size", 512),
                     "max_wait_time": getattr(config, "max_wait_time", 5000),
                     "export_flush_interval": getattr(config, "export_flush_interval", 1000),
+                    "export_timeout": getattr(config, "export_timeout", 10000),
                     "api_key": getattr(config, "api_key", None),
                     "project_id": getattr(config, "project_id", None),
                     "endpoint": getattr(config, "endpoint", None),
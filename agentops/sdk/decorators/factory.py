@@ -13,6 +13,14 @@ from .utility import (_create_as_current_span, _finalize_span, _make_span,
                      _record_entity_input, _record_entity_output)
 
 
+def _callable_name(func) -> str:
+    """Name of a decorated callable, including ones without __name__ (partials, callable instances)"""
+    name = getattr(func, "__name__", None)
+    if name is None and isinstance(func, functools.partial):
+        name = getattr(func.func, "__name__", None)
+    return name or type(func).__name__
+
+
 def create_entity_decorator(entity_kind: str):
     """
     Factory function that creates decorators for specific entity kinds.
@@ -64,6 +72,15 @@ def create_entity_decorator(entity_kind: str):
             
             return WrappedClass
             
+        # The wrapped function never changes, so resolve its name and kind
+        # (sync, async, generators) once here rather than on every call.
+        # staticmethod/classmethod objects are inspected via their underlying function.
+        func = getattr(wrapped, "__func__", wrapped)
+        operation_name = name or _callable_name(func)
+        is_async = asyncio.iscoroutinefunction(func) or inspect.iscoroutinefunction(func)
+        is_generator = inspect.isgeneratorfunction(func)
+        is_async_generator = inspect.isasyncgenfunction(func)
+
         # Create the actual decorator wrapper function for functions
         @wrapt.decorator
         def wrapper(wrapped, instance, args, kwargs):
@@ -71,14 +88,6 @@ def create_entity_decorator(entity_kind: str):
             if not TracingCore.get_instance()._initialized:
                 return wrapped(*args, **kwargs)
 
-            # Use provided name or function name
-            operation_name = name or wrapped.__name__
-
-            # Handle different types of functions (sync, async, generators)
-            is_async = asyncio.iscoroutinefunction(wrapped) or inspect.iscoroutinefunction(wrapped)
-            is_generator = inspect.isgeneratorfunction(wrapped)
-            is_async_generator = inspect.isasyncgenfunction(wrapped)
-
             # Handle generator functions
             if is_generator:
                 # Use the old approach for generators
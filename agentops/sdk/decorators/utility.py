@@ -1,4 +1,5 @@
 import inspect
+import logging
 import os
 import types
 import warnings
@@ -78,6 +79,27 @@ def _get_current_span_info():
     return {"name": "No current span"}
 
 
+def _span_attributes(
+    operation_name: str,
+    span_kind: str,
+    version: Optional[int],
+    attributes: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Add the span kind and standard operation attributes to a single attributes dict"""
+    if attributes is None:
+        # Common case: build the dict in one literal rather than filling an empty one
+        attributes = {
+            SpanAttributes.AGENTOPS_SPAN_KIND: span_kind,
+            "agentops.operation.name": operation_name,
+        }
+    else:
+        attributes[SpanAttributes.AGENTOPS_SPAN_KIND] = span_kind
+        attributes["agentops.operation.name"] = operation_name
+    if version is not None:
+        attributes["agentops.operation.version"] = version
+    return attributes
+
+
 @contextmanager
 def _create_as_current_span(
     operation_name: str,
@@ -101,9 +123,13 @@ def _create_as_current_span(
     Yields:
         A span with proper context that will be automatically closed when exiting the context
     """
+    # Context introspection is only worth doing when the debug output is kept
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     # Log before we do anything
-    before_span = _get_current_span_info()
-    logger.debug(f"[DEBUG] BEFORE {operation_name}.{span_kind} - Current context: {before_span}")
+    if debug:
+        before_span = _get_current_span_info()
+        logger.debug(f"[DEBUG] BEFORE {operation_name}.{span_kind} - Current context: {before_span}")
     
     # Create span with proper naming convention
     span_name = f"{operation_name}.{span_kind}"
@@ -112,16 +138,7 @@ def _create_as_current_span(
     tracer = TracingCore.get_instance().get_tracer()
 
     # Prepare attributes
-    if attributes is None:
-        attributes = {}
-
-    # Add span kind to attributes
-    attributes[SpanAttributes.AGENTOPS_SPAN_KIND] = span_kind
-
-    # Add standard attributes
-    attributes["agentops.operation.name"] = operation_name
-    if version is not None:
-        attributes["agentops.operation.version"] = version
+    attributes = _span_attributes(operation_name, span_kind, version, attributes)
 
     # Get current context explicitly to debug it
     current_context = context_api.get_current()
@@ -129,15 +146,16 @@ def _create_as_current_span(
     # Use OpenTelemetry's context manager to properly handle span lifecycle
     with tracer.start_as_current_span(span_name, attributes=attributes, context=current_context) as span:
         # Log after span creation
-        if hasattr(span, "get_span_context"):
+        if debug and hasattr(span, "get_span_context"):
             span_ctx = span.get_span_context()
             logger.debug(f"[DEBUG] CREATED {span_name} - span_id: {span_ctx.span_id:x}, parent: {before_span.get('span_id', 'None')}")
         
         yield span
     
     # Log after we're done
-    after_span = _get_current_span_info()
-    logger.debug(f"[DEBUG] AFTER {operation_name}.{span_kind} - Returned to context: {after_span}")
+    if debug:
+        after_span = _get_current_span_info()
+        logger.debug(f"[DEBUG] AFTER {operation_name}.{span_kind} - Returned to context: {after_span}")
 
 
 def _make_span(
@@ -164,9 +182,12 @@ def _make_span(
         - context is the span context
         - token is the context token needed for detaching
     """
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     # Log before we do anything
-    before_span = _get_current_span_info()
-    logger.debug(f"[DEBUG] BEFORE _make_span {operation_name}.{span_kind} - Current context: {before_span}")
+    if debug:
+        before_span = _get_current_span_info()
+        logger.debug(f"[DEBUG] BEFORE _make_span {operation_name}.{span_kind} - Current context: {before_span}")
     
     # Create span with proper naming convention
     span_name = f"{operation_name}.{span_kind}"
@@ -175,16 +196,7 @@ def _make_span(
     tracer = TracingCore.get_instance().get_tracer()
 
     # Prepare attributes
-    if attributes is None:
-        attributes = {}
-
-    # Add span kind to attributes
-    attributes[SpanAttributes.AGENTOPS_SPAN_KIND] = span_kind
-
-    # Add standard attributes
-    attributes["agentops.operation.name"] = operation_name
-    if version is not None:
-        attributes["agentops.operation.version"] = version
+    attributes = _span_attributes(operation_name, span_kind, version, attributes)
 
     # Get current context explicitly
     current_context = context_api.get_current()
@@ -197,7 +209,7 @@ def _make_span(
     token = context_api.attach(ctx)
     
     # Log after span creation
-    if hasattr(span, "get_span_context"):
+    if debug and hasattr(span, "get_span_context"):
         span_ctx = span.get_span_context()
         logger.debug(f"[DEBUG] CREATED _make_span {span_name} - span_id: {span_ctx.span_id:x}, parent: {before_span.get('span_id', 'None')}")
 
@@ -206,6 +218,9 @@ def _make_span(
 
 def _record_entity_input(span: trace.Span, args: tuple, kwargs: Dict[str, Any]) -> None:
     """Record operation input parameters to span if content tracing is enabled"""
+    if not span.is_recording():
+        # Attributes would be dropped anyway; don't pay for serialization
+        return
     try:
         input_data = {"args": args, "kwargs": kwargs}
         json_data = safe_serialize(input_data)
@@ -220,6 +235,8 @@ def _record_entity_input(span: trace.Span, args: tuple, kwargs: Dict[str, Any])
 
 def _record_entity_output(span: trace.Span, result: Any) -> None:
     """Record operation output value to span if content tracing is enabled"""
+    if not span.is_recording():
+        return
     try:
         json_data = safe_serialize(result)
 
@@ -233,18 +250,22 @@ def _record_entity_output(span: trace.Span, result: Any) -> None:
 
 def _finalize_span(span: trace.Span, token: Any) -> None:
     """End the span and detach the context token"""
-    if hasattr(span, "get_span_context") and hasattr(span.get_span_context(), "span_id"):
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    if debug and hasattr(span, "get_span_context") and hasattr(span.get_span_context(), "span_id"):
         span_id = f"{span.get_span_context().span_id:x}"
         logger.debug(f"[DEBUG] ENDING span {getattr(span, 'name', 'unknown')} - span_id: {span_id}")
     
     span.end()
     
     # Debug info before detaching
-    current_after_end = _get_current_span_info()
-    logger.debug(f"[DEBUG] AFTER span.end() - Current context: {current_after_end}")
+    if debug:
+        current_after_end = _get_current_span_info()
+        logger.debug(f"[DEBUG] AFTER span.end() - Current context: {current_after_end}")
     
     context_api.detach(token)
     
     # Debug info after detaching
-    final_context = _get_current_span_info()
-    logger.debug(f"[DEBUG] AFTER detach - Final context: {final_context}")
+    if debug:
+        final_context = _get_current_span_info()
+        logger.debug(f"[DEBUG] AFTER detach - Final context: {final_context}")
@@ -2,13 +2,20 @@ from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
 
 
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' for UTC"""
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+
 def format_duration(start_time, end_time) -> str:
     """Format duration between two timestamps"""
     if not start_time or not end_time:
         return "0.0s"
 
-    start = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-    end = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    start = _parse_iso(start_time)
+    end = _parse_iso(end_time)
     duration = end - start
 
     hours, remainder = divmod(duration.total_seconds(), 3600)
@@ -24,8 +31,11 @@ def format_duration(start_time, end_time) -> str:
     return " ".join(parts)
 
 
+_MICRO = Decimal("0.000001")
+
+
 def format_token_cost(cost: float | Decimal) -> str:
     """Format token cost to 2 decimal places, or 6 decimal places if non-zero"""
     if isinstance(cost, Decimal):
-        return "{:.6f}".format(cost.quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP))
+        return "{:.6f}".format(cost.quantize(_MICRO, rounding=ROUND_HALF_UP))
     return "{:.2f}".format(cost)
@@ -5,6 +5,7 @@ This module contains processors for OpenTelemetry spans.
 """
 
 import copy
+import logging
 import threading
 import time
 from threading import Event, Lock, Thread
@@ -25,22 +26,54 @@ class LiveSpanProcessor(SpanProcessor):
     def __init__(self, span_exporter: SpanExporter, **kwargs):
         self.span_exporter = span_exporter
         self._in_flight: Dict[int, Span] = {}
+        # Ended spans are coalesced and shipped with the next periodic export
+        # rather than costing one export request each
+        self._ended: List[ReadableSpan] = []
         self._lock = Lock()
+        # Held across taking a snapshot and exporting it, so exports leave in the
+        # order their snapshots were taken (a stale in-flight copy of a span can
+        # never follow its final version). Always acquired before `_lock`, which
+        # is only held for the snapshot itself so on_start/on_end aren't blocked
+        # on the exporter.
+        self._export_lock = Lock()
         self._stop_event = Event()
         self._export_thread = Thread(target=self._export_periodically, daemon=True)
         self._export_thread.start()
 
     def _export_periodically(self) -> None:
-        while not self._stop_event.is_set():
-            time.sleep(1)
-            with self._lock:
-                to_export = [self._readable_span(span) for span in self._in_flight.values()]
+        # Waiting on the stop event instead of sleeping lets shutdown() wake the
+        # thread immediately rather than blocking join() for up to a second
+        while not self._stop_event.wait(1):
+            with self._export_lock:
+                with self._lock:
+                    to_export = self._snapshot_in_flight()
+                    to_export.extend(self._ended)
+                    self._ended = []
                 if to_export:
                     self.span_exporter.export(to_export)
 
-    def _readable_span(self, span: Span) -> ReadableSpan:
+    def _export_ended(self, timeout: float = -1) -> bool:
+        """Export the ended spans; returns False if `_export_lock` wasn't acquired within `timeout` seconds"""
+        if not self._export_lock.acquire(timeout=timeout):
+            return False
+        try:
+            with self._lock:
+                ended, self._ended = self._ended, []
+            if ended:
+                self.span_exporter.export(ended)
+        finally:
+            self._export_lock.release()
+        return True
+
+    def _snapshot_in_flight(self) -> List[ReadableSpan]:
+        """Copies of the in-flight spans; call with `_lock` held"""
+        now = time.time_ns()
+        return [self._readable_span(span, now) for span in self._in_flight.values()]
+
+    def _readable_span(self, span: Span, end_time: Optional[int] = None) -> ReadableSpan:
         readable = span._readable_span()
-        readable._end_time = time.time_ns()
+        # Snapshots taken together share one provisional end time
+        readable._end_time = end_time if end_time is not None else time.time_ns()
         readable._attributes = {
             **(readable._attributes or {}),
             CoreAttributes.IN_FLIGHT: True,
@@ -48,25 +81,28 @@ class LiveSpanProcessor(SpanProcessor):
         return readable
 
     def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
-        if not span.context or not span.context.trace_flags.sampled:
+        ctx = span.context
+        if not ctx or not ctx.trace_flags.sampled:
             return
         with self._lock:
-            self._in_flight[span.context.span_id] = span
+            self._in_flight[ctx.span_id] = span
 
     def on_end(self, span: ReadableSpan) -> None:
-        if not span.context or not span.context.trace_flags.sampled:
+        ctx = span.context
+        if not ctx or not ctx.trace_flags.sampled:
             return
         with self._lock:
-            del self._in_flight[span.context.span_id]
-            self.span_exporter.export((span,))
+            del self._in_flight[ctx.span_id]
+            self._ended.append(span)
 
     def shutdown(self) -> None:
         self._stop_event.set()
         self._export_thread.join()
+        self._export_ended()
         self.span_exporter.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
-        return True
+        return self._export_ended(timeout=timeout_millis / 1000)
 
     def export_in_flight_spans(self) -> None:
         """Export all in-flight spans without ending them.
@@ -74,8 +110,9 @@ class LiveSpanProcessor(SpanProcessor):
         This method is primarily used for testing to ensure all spans
         are exported before assertions are made.
         """
-        with self._lock:
-            to_export = [self._readable_span(span) for span in self._in_flight.values()]
+        with self._export_lock:
+            with self._lock:
+                to_export = self._snapshot_in_flight()
             if to_export:
                 self.span_exporter.export(to_export)
 
@@ -97,6 +134,12 @@ class InternalSpanProcessor(SpanProcessor):
             app_url: The base URL for the AgentOps dashboard.
         """
         self.app_url = app_url
+        self._session_url_prefix = f"{app_url}/drilldown?session_id="
+        # Session URLs built at session start, reused for the replay banner at end
+        self._session_urls: Dict[int, str] = {}
+        # Banner templates are colored once; only the URL is filled in per session
+        self._start_banner = colored("\x1b[34mSession started: {}\x1b[0m", "light_green")
+        self._replay_banner = colored("\x1b[34mSession Replay: {}\x1b[0m", "blue")
 
     def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
         """
@@ -107,32 +150,25 @@ class InternalSpanProcessor(SpanProcessor):
             parent_context: The parent context, if any.
         """
         # Skip if span is not sampled
-        if not span.context or not span.context.trace_flags.sampled:
+        ctx = span.context
+        if not ctx or not ctx.trace_flags.sampled:
             return
 
         # Get the span kind from attributes
-        span_kind = (
-            span.attributes.get(semconv.SpanAttributes.AGENTOPS_SPAN_KIND, "unknown") if span.attributes else "unknown"
-        )
-
-        # Print basic information about the span
-        logger.debug(f"Started span: {span.name} (kind: {span_kind})")
+        attributes = span.attributes
+        span_kind = attributes.get(semconv.SpanAttributes.AGENTOPS_SPAN_KIND, "unknown") if attributes else "unknown"
 
         # Special handling for session spans
         if span_kind == semconv.SpanKind.SESSION:
-            trace_id = span.context.trace_id
+            trace_id = ctx.trace_id
             # Convert trace_id to hex string if it's not already
-            if isinstance(trace_id, int):
-                session_url = f"{self.app_url}/drilldown?session_id={trace_id_to_uuid(trace_id)}"
-                logger.info(
-                    colored(
-                        f"\x1b[34mSession started: {session_url}\x1b[0m",
-                        "light_green",
-                    )
-                )
-        else:
+            if isinstance(trace_id, int) and logger.isEnabledFor(logging.INFO):
+                session_url = f"{self._session_url_prefix}{trace_id_to_uuid(trace_id)}"
+                self._session_urls[trace_id] = session_url
+                logger.info(self._start_banner.format(session_url))
+        elif logger.isEnabledFor(logging.DEBUG):
             # Print basic information for other span kinds
-            logger.debug(f"Ended span: {span.name} (kind: {span_kind})")
+            logger.debug(f"Started span: {span.name} (kind: {span_kind})")
 
     def on_end(self, span: ReadableSpan) -> None:
         """
@@ -142,27 +178,25 @@ class InternalSpanProcessor(SpanProcessor):
             span: The span that was ended.
         """
         # Skip if span is not sampled
-        if not span.context or not span.context.trace_flags.sampled:
+        ctx = span.context
+        if not ctx or not ctx.trace_flags.sampled:
             return
 
         # Get the span kind from attributes
-        span_kind = (
-            span.attributes.get(semconv.SpanAttributes.AGENTOPS_SPAN_KIND, "unknown") if span.attributes else "unknown"
-        )
+        attributes = span.attributes
+        span_kind = attributes.get(semconv.SpanAttributes.AGENTOPS_SPAN_KIND, "unknown") if attributes else "unknown"
 
         # Special handling for session spans
         if span_kind == semconv.SpanKind.SESSION:
-            trace_id = span.context.trace_id
+            trace_id = ctx.trace_id
+            session_url = self._session_urls.pop(trace_id, None)
             # Convert trace_id to hex string if it's not already
-            if isinstance(trace_id, int):
-                session_url = f"{self.app_url}/drilldown?session_id={trace_id_to_uuid(trace_id)}"
-                logger.info(
-                    colored(
-                        f"\x1b[34mSession Replay: {session_url}\x1b[0m",
-                        "blue",
-                    )
+            if isinstance(trace_id, int) and logger.isEnabledFor(logging.INFO):
+                session_url = session_url or (
+                    f"{self._session_url_prefix}{trace_id_to_uuid(trace_id)}"
                 )
-        else:
+                logger.info(self._replay_banner.format(session_url))
+        elif logger.isEnabledFor(logging.DEBUG):
             # Print basic information for other span kinds
             logger.debug(f"Ended span: {span.name} (kind: {span_kind})")
 
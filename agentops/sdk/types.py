@@ -19,3 +19,4 @@ class TracingConfig(TypedDict, total=False):
     max_queue_size: int  # Required with a default value
     max_wait_time: int  # Required with a default value
     export_flush_interval: int  # Time interval between automatic exports
+    export_timeout: int  # Maximum duration of a single export request
@@ -80,17 +80,18 @@ def vcr_config():
         ("x-stainless-runtime-version", "REDACTED"),
     ]
 
+    # Lowercase header name -> replacement, built once for every recorded response
+    sensitive_lookup = {header.lower(): replacement for header, replacement in sensitive_headers}
+
     def filter_response_headers(response):
         """Filter sensitive headers from response."""
         headers = response["headers"]
-        headers_lower = {k.lower(): k for k in headers}  # Map of lowercase -> original header names
 
-        for header, replacement in sensitive_headers:
-            header_lower = header.lower()
-            if header_lower in headers_lower:
+        for header in headers:
+            replacement = sensitive_lookup.get(header.lower())
+            if replacement is not None:
                 # Replace using the original header name from the response
-                original_header = headers_lower[header_lower]
-                headers[original_header] = replacement
+                headers[header] = replacement
         return response
 
     vcr_config = {
@@ -125,10 +125,7 @@ class InstrumentationTester:
 
     def reset(self):
         """Reset the instrumentation tester."""
-        # Force flush any pending spans
-        self.span_processor.force_flush()
-
-        # Clear any existing spans
+        # Flush any pending spans and clear them (clear_spans flushes first)
         self.clear_spans()
 
         # Reset global trace state
@@ -0,0 +1,15 @@
+from agentops.sdk.converters import dict_to_span_attributes
+
+
+def test_dict_to_span_attributes_applies_prefix_once_to_nested_keys():
+    data = {"a": 1, "b": {"c": "x", "d": {"e": True}}}
+
+    assert dict_to_span_attributes(data, prefix="p.") == {
+        "p.a": 1,
+        "p.b.c": "x",
+        "p.b.d.e": True,
+    }
+
+
+def test_dict_to_span_attributes_flattens_nested_keys_without_prefix():
+    assert dict_to_span_attributes({"b": {"c": [1, 2]}}) == {"b.c": [1, 2]}
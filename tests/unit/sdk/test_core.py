@@ -0,0 +1,16 @@
+from unittest import mock
+
+from agentops.sdk.core import TracingCore
+
+
+def test_shutdown_flushes_within_max_wait_time_before_provider_shutdown():
+    core = TracingCore()
+    provider = mock.MagicMock()
+    core._provider = provider
+    core._config = {"max_wait_time": 1234}
+    core._initialized = True
+
+    core.shutdown()
+
+    assert provider.method_calls == [mock.call.force_flush(1234), mock.call.shutdown()]
+    assert not core.initialized
@@ -478,4 +478,38 @@ class TestSpanNesting:
         assert level2_operation.context is not None
         assert level3_operation.parent.span_id == level2_operation.context.span_id
 
-    
+
+def test_entity_io_not_serialized_for_non_recording_span(mocker):
+    """Input/output serialization is skipped when the span won't record attributes."""
+    from agentops.sdk.decorators import utility
+
+    serialize = mocker.patch.object(utility, "safe_serialize")
+    span = trace.NonRecordingSpan(trace.INVALID_SPAN_CONTEXT)
+
+    utility._record_entity_input(span, ("arg",), {"key": "value"})
+    utility._record_entity_output(span, "result")
+
+    serialize.assert_not_called()
+
+
+def test_decorating_callables_without_name(instrumentation: InstrumentationTester):
+    """Partials and callable instances have no __name__ but can still be decorated."""
+    import functools
+
+    def add(a, b):
+        return a + b
+
+    class Multiplier:
+        def __call__(self, a, b):
+            return a * b
+
+    add_one = operation(functools.partial(add, 1))
+    multiply = operation(Multiplier())
+
+    assert add_one(2) == 3
+    assert multiply(2, 3) == 6
+
+    operation_names = {
+        span.attributes["agentops.operation.name"] for span in instrumentation.get_finished_spans()
+    }
+    assert operation_names == {"add", "Multiplier"}
@@ -0,0 +1,86 @@
+import threading
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+from agentops.sdk.processors import LiveSpanProcessor
+from agentops.semconv.core import CoreAttributes
+
+
+class _BlockingExporter(SpanExporter):
+    """Records each export; the first one blocks until released"""
+
+    def __init__(self):
+        self.batches = []
+        self.first_export_started = threading.Event()
+        self.release = threading.Event()
+
+    def export(self, spans):
+        if not self.batches:
+            self.batches.append(list(spans))
+            self.first_export_started.set()
+            self.release.wait(5)
+        else:
+            self.batches.append(list(spans))
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        pass
+
+
+def test_live_span_processor_never_exports_stale_snapshot_after_final_span():
+    exporter = _BlockingExporter()
+    processor = LiveSpanProcessor(exporter)
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    span = provider.get_tracer("test").start_span("work")
+
+    try:
+        # Snapshot the span while in flight; the export of that snapshot stalls
+        snapshot = threading.Thread(target=processor.export_in_flight_spans)
+        snapshot.start()
+        assert exporter.first_export_started.wait(5)
+
+        # The span ends and is flushed while the stale snapshot is still exporting
+        span.end()
+        flush = threading.Thread(target=processor.force_flush)
+        flush.start()
+        flush.join(0.1)
+        assert flush.is_alive(), "force_flush must wait for the in-flight export"
+
+        exporter.release.set()
+        snapshot.join(5)
+        flush.join(5)
+    finally:
+        exporter.release.set()
+        processor.shutdown()
+
+    in_flight_export, final_export = exporter.batches[:2]
+    assert in_flight_export[0].attributes[CoreAttributes.IN_FLIGHT] is True
+    assert CoreAttributes.IN_FLIGHT not in (final_export[0].attributes or {})
+
+
+def test_live_span_processor_force_flush_gives_up_after_timeout():
+    exporter = _BlockingExporter()
+    processor = LiveSpanProcessor(exporter)
+    provider = TracerProvider()
+    provider.add_span_processor(processor)
+    span = provider.get_tracer("test").start_span("work")
+
+    try:
+        snapshot = threading.Thread(target=processor.export_in_flight_spans)
+        snapshot.start()
+        assert exporter.first_export_started.wait(5)
+
+        span.end()
+        start = time.monotonic()
+        assert processor.force_flush(timeout_millis=50) is False
+        assert time.monotonic() - start < 1
+
+        exporter.release.set()
+        snapshot.join(5)
+        assert processor.force_flush(timeout_millis=1000) is True
+    finally:
+        exporter.release.set()
+        processor.shutdown()
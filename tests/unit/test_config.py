@@ -80,3 +80,17 @@ def test_config_override_env(mock_env, valid_uuid):
 
 def test_invalid_api_key():
     """Test handling of invalid API key raises InvalidApiKeyException"""
+
+
+def test_export_timeout_is_separate_from_max_wait_time(mock_env):
+    """The exporter timeout has its own setting and doesn't follow max_wait_time"""
+    config = Config()
+    assert config.max_wait_time == 1000
+    assert config.export_timeout == 10000
+
+    os.environ["AGENTOPS_EXPORT_TIMEOUT"] = "2500"
+    assert Config().export_timeout == 2500
+
+    config.configure(export_timeout=3000, max_wait_time=50)
+    assert config.export_timeout == 3000
+    assert config.dict()["export_timeout"] == 3000
@@ -1,8 +1,5 @@
 import time
 
-import pytest
-import requests_mock
-
 import agentops
 from agentops import ActionEvent, ErrorEvent
 
@@ -27,3 +24,42 @@ class TestEvents:
         event = ErrorEvent(logs=None)
         time.sleep(0.15)
         agentops.record(event)
+
+
+def test_legacy_event_to_json_skips_unset_fields():
+    from agentops.legacy.event import ToolEvent
+
+    event = ToolEvent(name="search", params={"query": "agentops"})
+    data = event.to_json()
+
+    assert data["event_type"] == "tools"
+    assert data["name"] == "search"
+    assert data["params"] == {"query": "agentops"}
+    assert "returns" not in data
+    assert "logs" not in data
+
+
+def test_legacy_error_event_logs_traceback_only_for_exceptions():
+    from agentops.legacy.event import ErrorEvent
+
+    assert ErrorEvent().logs is None
+
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        event = ErrorEvent(exception=e)
+
+    assert event.error_type == "ValueError"
+    assert "ValueError: boom" in event.logs
+
+
+def test_legacy_event_shims_accept_arbitrary_attributes():
+    event = agentops.ActionEvent(action_type="search")
+    event.returns = "result"
+    event.logs = ["step 1"]
+
+    error = agentops.ErrorEvent()
+    error.details = "boom"
+
+    assert event.returns == "result"
+    assert type(event) is type(error)
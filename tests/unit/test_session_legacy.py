@@ -131,14 +131,14 @@ def test_crewai_kwargs_pattern_no_session(instrumentation):
 def test_crewai_kwargs_force_flush():
     """
     Test that when using the CrewAI < 0.105.0 pattern (end_session with kwargs),
-    the spans are properly exported to the backend with force_flush.
+    the session is ended and a flush of the span processors is scheduled
+    without shutting down the tracing core.
     
-    This is a more comprehensive test that ensures spans are actually sent
-    to the backend when using the CrewAI integration pattern.
+    The flush itself runs on a background worker; see
+    test_end_session_flushes_in_background / test_end_session_wait_flushes_synchronously.
     """
     import agentops
     from agentops.sdk.core import TracingCore
-    import time
     
     # Initialize AgentOps with API key
     agentops.init(api_key="test-api-key")
@@ -146,9 +146,6 @@ def test_crewai_kwargs_force_flush():
     # Create a session
     session = agentops.start_session(tags=["test", "crewai-integration"])
     
-    # Simulate some work
-    time.sleep(0.1)
-    
     # End session with kwargs (CrewAI < 0.105.0 pattern)
     agentops.end_session(
         end_state="Success",
@@ -157,4 +154,48 @@ def test_crewai_kwargs_force_flush():
     )
     
     # Explicitly ensure the core isn't already shut down for the test
-    assert TracingCore.get_instance()._initialized, "TracingCore should still be initialized"
\ No newline at end of file
+    assert TracingCore.get_instance()._initialized, "TracingCore should still be initialized"
+
+def _record_flush_threads(mocker):
+    """Patch the legacy flush and record which thread each flush ran on"""
+    import threading
+
+    threads = []
+    mocker.patch("agentops.legacy._force_flush", side_effect=lambda: threads.append(threading.current_thread()))
+    return threads
+
+
+def test_end_session_flushes_in_background(instrumentation, mocker):
+    import threading
+
+    import agentops
+    from agentops.legacy import _flush_executor
+
+    agentops.init(api_key="test-api-key")
+    threads = _record_flush_threads(mocker)
+
+    session = agentops.start_session()
+    agentops.end_session(session, end_state="Success")
+
+    # The single flush worker runs jobs in order; wait for it to drain
+    _flush_executor.submit(lambda: None).result(timeout=5)
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_end_session_wait_flushes_synchronously(instrumentation, mocker):
+    import threading
+
+    import agentops
+
+    agentops.init(api_key="test-api-key")
+    threads = _record_flush_threads(mocker)
+
+    session = agentops.start_session()
+    session.end_session(wait=True, end_state="Success")
+    assert threads == [threading.current_thread()]
+
+    agentops.start_session()
+    agentops.end_session(wait=True, end_state="Success")
+    assert threads == [threading.current_thread()] * 2
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from agentops.helpers.time import from_unix_nano_to_iso, get_ISO_time, iso_to_unix_nano
+
+
+def test_get_iso_time_matches_datetime_isoformat():
+    before = datetime.now(timezone.utc)
+    timestamp = get_ISO_time()
+    after = datetime.now(timezone.utc)
+
+    parsed = datetime.fromisoformat(timestamp)
+    assert parsed.isoformat() == timestamp
+    assert parsed.tzinfo is not None
+    assert before <= parsed <= after
+
+
+def test_unix_nano_round_trip_is_exact():
+    timestamp = "2024-05-06T07:08:09.123457+00:00"
+
+    unix_nano = iso_to_unix_nano(timestamp)
+
+    assert unix_nano == 1714979289123457000
+    assert from_unix_nano_to_iso(unix_nano) == timestamp